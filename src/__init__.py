@@ -9,10 +9,14 @@ __version__ = "0.1.0"
 __author__ = "EigenLayer Analysis Team"
 __email__ = "analysis@eigenlayer.xyz"
 
-from .core.client import EigenLayerClient
-from .database.manager import DatabaseManager
-from .query.engine import QueryEngine
-from .cache.manager import CacheManager
+# Public classes are imported on first attribute access (PEP 562) so that
+# importing the package does not pull in duckdb, pandas and friends.
+_LAZY_IMPORTS = {
+    "EigenLayerClient": ".core.client",
+    "DatabaseManager": ".database.manager",
+    "QueryEngine": ".query.engine",
+    "CacheManager": ".cache.manager",
+}
 
 __all__ = [
     "EigenLayerClient",
@@ -20,4 +24,16 @@ __all__ = [
     "QueryEngine",
     "CacheManager",
     "__version__"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import public classes lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,29 @@
 """
 Default configuration values.
+
+DEFAULT_CONFIG is read-only; merge overrides into a copy instead of
+modifying it.
 """
 
-DEFAULT_CONFIG = {
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def _freeze(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Recursively wrap a config dict in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
+
+DEFAULT_CONFIG = _freeze({
     "database": {
         "path": "eigenlayer_data.duckdb",
         "auto_vacuum": True,
-        "timeout": 30
+        "timeout": 30,
+        "threads": None,
+        "memory_limit": None
     },
     "cache": {
         "directory": ".cache",
@@ -36,4 +53,4 @@ DEFAULT_CONFIG = {
         "allocation_manager": "0xA44151489861Fe9e3055d95adC98FbD462B948e7",
         "avs_directory": "0x135DDa560e946695d6f155dACaFC6f1F25C1F5AF"
     }
-}
\ No newline at end of file
+})
@@ -3,27 +3,94 @@ Application settings management.
 """
 
 import os
+import re
+import copy
 import json
+import dataclasses
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 import logging
 
 from .defaults import DEFAULT_CONFIG
 from ..core.exceptions import ConfigurationError
+from ..core.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in ("true", "1", "yes", "on")
 
-@dataclass
+
+# Environment variable -> (section, key, converter) overrides
+_ENV_SPEC = {
+    # Database
+    "EIGENLAYER_DB_PATH": ("database", "path", str),
+    "EIGENLAYER_DB_TIMEOUT": ("database", "timeout", int),
+    "EIGENLAYER_DB_AUTO_VACUUM": ("database", "auto_vacuum", _parse_bool),
+    "EIGENLAYER_DB_THREADS": ("database", "threads", int),
+    "EIGENLAYER_DB_MEMORY_LIMIT": ("database", "memory_limit", str),
+    
+    # Cache
+    "EIGENLAYER_CACHE_DIR": ("cache", "directory", str),
+    "EIGENLAYER_CACHE_TTL": ("cache", "default_ttl", int),
+    "EIGENLAYER_CACHE_MAX_SIZE": ("cache", "max_size_mb", int),
+    
+    # Network
+    "ETH_RPC_URL": ("network", "rpc_url", str),
+    "EIGENLAYER_RPC_TIMEOUT": ("network", "rpc_timeout", int),
+    "EIGENLAYER_MAX_RETRIES": ("network", "max_retries", int),
+    "EIGENLAYER_RATE_LIMIT_DELAY": ("network", "rate_limit_delay", float),
+    
+    # API
+    "COINGECKO_API_KEY": ("api", "coingecko_api_key", str),
+    "COINGECKO_BASE_URL": ("api", "coingecko_base_url", str),
+    
+    # Logging
+    "EIGENLAYER_LOG_LEVEL": ("logging", "level", str),
+    "EIGENLAYER_LOG_FILE": ("logging", "file", str),
+}
+
+# 20-byte hex address, case-insensitive
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+class _LazyFileHandler(logging.Handler):
+    """Log file handler that only opens its file when the first record is emitted."""
+    
+    def __init__(self, filename: str):
+        super().__init__()
+        self.filename = filename
+        self._handler: Optional[logging.FileHandler] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self._handler is None:
+                self._handler = logging.FileHandler(self.filename)
+                self._handler.setFormatter(self.formatter)
+            self._handler.emit(record)
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
+        super().close()
+
+
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
     path: str = "eigenlayer_data.duckdb"
     auto_vacuum: bool = True
     timeout: int = 30
+    threads: Optional[int] = None
+    memory_limit: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Cache configuration."""
     directory: str = ".cache"
@@ -32,7 +99,7 @@ class CacheConfig:
     cleanup_interval: int = 86400
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkConfig:
     """Network configuration."""
     rpc_url: str = "https://eth.llamarpc.com"
@@ -41,7 +108,7 @@ class NetworkConfig:
     rate_limit_delay: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """External API configuration."""
     coingecko_api_key: Optional[str] = None
@@ -49,7 +116,7 @@ class APIConfig:
     coingecko_timeout: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -57,7 +124,7 @@ class LoggingConfig:
     file: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractConfig:
     """Smart contract configuration."""
     delegation_manager: str = "0x39053D51B77DC0d36036Fc1fCc8Cb819df8Ef37A"
@@ -66,7 +133,7 @@ class ContractConfig:
     avs_directory: str = "0x135DDa560e946695d6f155dACaFC6f1F25C1F5AF"
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Main application settings."""
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
@@ -87,21 +154,22 @@ class Settings:
         Returns:
             Settings instance
         """
-        # Start with default configuration
-        config = DEFAULT_CONFIG.copy()
+        overrides: Dict[str, Any] = {}
         
         # Load from config file if provided
         if config_path and Path(config_path).exists():
             try:
                 with open(config_path, 'r') as f:
-                    file_config = json.load(f)
-                    config = cls._deep_merge(config, file_config)
-                logger.info(f"Loaded configuration from {config_path}")
+                    overrides = json.load(f)
+                logger.info("Loaded configuration from %s", config_path)
             except Exception as e:
                 raise ConfigurationError(f"Failed to load config file: {e}")
         
-        # Override with environment variables
-        config = cls._load_from_env(config)
+        # Environment variables take precedence over the config file
+        overrides = cls._load_from_env(overrides)
+        
+        # The read-only defaults are used as-is unless something overrides them
+        config = cls._deep_merge(DEFAULT_CONFIG, overrides) if overrides else DEFAULT_CONFIG
         
         # Create settings instance
         try:
@@ -117,68 +185,42 @@ class Settings:
             raise ConfigurationError(f"Invalid configuration: {e}")
     
     @staticmethod
-    def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = base.copy()
-        
+    def _deep_merge(base: Mapping[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """Deep merge two mappings into a new dict without modifying either."""
+        result = Settings._thaw(base)
+        Settings._merge_into(result, override)
+        return result
+    
+    @staticmethod
+    def _thaw(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+        """Deep copy a possibly read-only mapping into plain dicts."""
+        return {
+            key: Settings._thaw(value) if isinstance(value, Mapping) else copy.deepcopy(value)
+            for key, value in mapping.items()
+        }
+    
+    @staticmethod
+    def _merge_into(target: Dict[str, Any], override: Dict[str, Any]) -> None:
+        """Recursively merge override into target in place."""
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = Settings._deep_merge(result[key], value)
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                Settings._merge_into(current, value)
             else:
-                result[key] = value
-        
-        return result
+                target[key] = value
     
     @staticmethod
     def _load_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
         """Load configuration from environment variables."""
-        env_mappings = {
-            # Database
-            "EIGENLAYER_DB_PATH": ("database", "path"),
-            "EIGENLAYER_DB_TIMEOUT": ("database", "timeout"),
-            
-            # Cache
-            "EIGENLAYER_CACHE_DIR": ("cache", "directory"),
-            "EIGENLAYER_CACHE_TTL": ("cache", "default_ttl"),
-            "EIGENLAYER_CACHE_MAX_SIZE": ("cache", "max_size_mb"),
-            
-            # Network
-            "ETH_RPC_URL": ("network", "rpc_url"),
-            "EIGENLAYER_RPC_TIMEOUT": ("network", "rpc_timeout"),
-            "EIGENLAYER_MAX_RETRIES": ("network", "max_retries"),
+        for env_var, (section, key, converter) in _ENV_SPEC.items():
+            value = os.environ.get(env_var)
+            if value is None:
+                continue
             
-            # API
-            "COINGECKO_API_KEY": ("api", "coingecko_api_key"),
-            "COINGECKO_BASE_URL": ("api", "coingecko_base_url"),
-            
-            # Logging
-            "EIGENLAYER_LOG_LEVEL": ("logging", "level"),
-            "EIGENLAYER_LOG_FILE": ("logging", "file"),
-        }
-        
-        for env_var, (section, key) in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                if section not in config:
-                    config[section] = {}
-                
-                # Type conversion
-                if key in ["timeout", "default_ttl", "max_size_mb", "rpc_timeout", "max_retries"]:
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        logger.warning(f"Invalid integer value for {env_var}: {value}")
-                        continue
-                elif key in ["rate_limit_delay"]:
-                    try:
-                        value = float(value)
-                    except ValueError:
-                        logger.warning(f"Invalid float value for {env_var}: {value}")
-                        continue
-                elif key in ["auto_vacuum"]:
-                    value = value.lower() in ("true", "1", "yes", "on")
-                
-                config[section][key] = value
+            try:
+                config.setdefault(section, {})[key] = converter(value)
+            except ValueError:
+                logger.warning("Invalid %s value for %s: %s", converter.__name__, env_var, value)
         
         return config
     
@@ -189,47 +231,21 @@ class Settings:
         Args:
             config_path: Path to save configuration file
         """
-        config = {
-            "database": {
-                "path": self.database.path,
-                "auto_vacuum": self.database.auto_vacuum,
-                "timeout": self.database.timeout
-            },
-            "cache": {
-                "directory": self.cache.directory,
-                "default_ttl": self.cache.default_ttl,
-                "max_size_mb": self.cache.max_size_mb,
-                "cleanup_interval": self.cache.cleanup_interval
-            },
-            "network": {
-                "rpc_url": self.network.rpc_url,
-                "rpc_timeout": self.network.rpc_timeout,
-                "max_retries": self.network.max_retries,
-                "rate_limit_delay": self.network.rate_limit_delay
-            },
-            "api": {
-                "coingecko_api_key": self.api.coingecko_api_key,
-                "coingecko_base_url": self.api.coingecko_base_url,
-                "coingecko_timeout": self.api.coingecko_timeout
-            },
-            "logging": {
-                "level": self.logging.level,
-                "format": self.logging.format,
-                "file": self.logging.file
-            },
-            "contracts": {
-                "delegation_manager": self.contracts.delegation_manager,
-                "strategy_manager": self.contracts.strategy_manager,
-                "allocation_manager": self.contracts.allocation_manager,
-                "avs_directory": self.contracts.avs_directory
-            }
-        }
+        data = dumps(dataclasses.asdict(self), indent=True)
         
+        # Write to a sibling temp file and rename over the target so a
+        # crash never leaves a truncated config behind
+        tmp_path = f"{config_path}.tmp"
         try:
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
-            logger.info(f"Configuration saved to {config_path}")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, config_path)
+            logger.info("Configuration saved to %s", config_path)
         except Exception as e:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             raise ConfigurationError(f"Failed to save config: {e}")
     
     def setup_logging(self) -> None:
@@ -243,9 +259,9 @@ class Settings:
         console_handler.setFormatter(logging.Formatter(self.logging.format))
         handlers.append(console_handler)
         
-        # File handler if specified
+        # File handler if specified, the file is opened on first use
         if self.logging.file:
-            file_handler = logging.FileHandler(self.logging.file)
+            file_handler = _LazyFileHandler(self.logging.file)
             file_handler.setFormatter(logging.Formatter(self.logging.format))
             handlers.append(file_handler)
         
@@ -256,7 +272,7 @@ class Settings:
             force=True
         )
         
-        logger.info(f"Logging configured: level={self.logging.level}")
+        logger.info("Logging configured: level=%s", self.logging.level)
     
     def validate(self) -> None:
         """Validate configuration settings."""
@@ -281,15 +297,10 @@ class Settings:
             errors.append("RPC timeout must be positive")
         
         # Contract validation
-        required_contracts = [
-            self.contracts.delegation_manager,
-            self.contracts.strategy_manager,
-            self.contracts.avs_directory
-        ]
-        
-        for contract in required_contracts:
-            if not contract or len(contract) != 42 or not contract.startswith("0x"):
-                errors.append(f"Invalid contract address: {contract}")
+        for name, address in dataclasses.asdict(self.contracts).items():
+            if not _ADDRESS_RE.fullmatch(address or ""):
+                errors.append(f"Invalid contract address {name}: {address}")
         
         if errors:
-            raise ConfigurationError(f"Configuration validation failed: {'; '.join(errors)}")
\ No newline at end of file
+            raise ConfigurationError(f"Configuration validation failed: {'; '.join(errors)}")
+
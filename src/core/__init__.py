@@ -4,7 +4,6 @@ Core EigenLayer Analysis Components
 Contains the main client interface and core business logic.
 """
 
-from .client import EigenLayerClient
 from .models import OperatorStats, AVSMetrics, StrategyInfo
 from .exceptions import EigenLayerError, RateLimitError, CacheError
 
@@ -16,4 +15,12 @@ __all__ = [
     "EigenLayerError",
     "RateLimitError", 
     "CacheError"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the client lazily, it depends on the database stack."""
+    if name == "EigenLayerClient":
+        from .client import EigenLayerClient
+        return EigenLayerClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
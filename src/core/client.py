@@ -3,14 +3,15 @@ Main client interface for EigenLayer analysis.
 """
 
 from typing import List, Optional, Dict, Any
+import csv
+import dataclasses
 import logging
+import os
 from pathlib import Path
 
-from ..database.manager import DatabaseManager
-from ..query.engine import QueryEngine
-from ..cache.manager import CacheManager
 from ..config.settings import Settings
 from .models import OperatorStats, AVSMetrics, SystemMetrics
+from .serialization import dumps
 from .exceptions import EigenLayerError
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,8 @@ class EigenLayerClient:
         self,
         config_path: Optional[str] = None,
         db_path: Optional[str] = None,
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        settings: Optional[Settings] = None
     ):
         """
         Initialize the EigenLayer client.
@@ -37,13 +39,21 @@ class EigenLayerClient:
             config_path: Path to configuration file
             db_path: Path to database file
             cache_dir: Path to cache directory
+            settings: Preloaded settings, used instead of config_path
         """
+        # Deferred so importing the client module stays cheap
+        from ..database.manager import DatabaseManager
+        from ..query.engine import QueryEngine
+        from ..cache.manager import CacheManager
+        
         # Load configuration
-        self.settings = Settings.load(config_path)
+        self.settings = settings or Settings.load(config_path)
         
         # Initialize components
         self.db_manager = DatabaseManager(
-            db_path or self.settings.database.path
+            db_path or self.settings.database.path,
+            threads=self.settings.database.threads,
+            memory_limit=self.settings.database.memory_limit
         )
         self.cache_manager = CacheManager(
             cache_dir or self.settings.cache.directory
@@ -54,9 +64,9 @@ class EigenLayerClient:
             settings=self.settings
         )
         
-        logger.info(f"EigenLayer client initialized")
-        logger.info(f"Database: {self.db_manager.db_path}")
-        logger.info(f"Cache: {self.cache_manager.cache_dir}")
+        logger.info("EigenLayer client initialized")
+        logger.info("Database: %s", self.db_manager.db_path)
+        logger.info("Cache: %s", self.cache_manager.cache_dir)
     
     def setup_database(self) -> None:
         """Initialize the database schema and import base data."""
@@ -78,6 +88,7 @@ class EigenLayerClient:
             from ..database.importers import DataImporter
             importer = DataImporter(self.db_manager)
             importer.import_all_data(force_refresh=force_refresh)
+            self.db_manager.refresh_materialized_views()
             logger.info("Data import completed")
         except Exception as e:
             raise EigenLayerError(f"Data import failed: {e}")
@@ -146,7 +157,7 @@ class EigenLayerClient:
     def clear_cache(self, cache_type: Optional[str] = None) -> None:
         """Clear cache files."""
         self.cache_manager.clear_cache(cache_type)
-        logger.info(f"Cache cleared: {cache_type or 'all'}")
+        logger.info("Cache cleared: %s", cache_type or 'all')
     
     # Export methods
     def export_operators(self, file_path: str, format: str = "json") -> None:
@@ -160,40 +171,70 @@ class EigenLayerClient:
         self._export_data(data, file_path, format)
     
     def export_system_report(self, file_path: str) -> None:
-        """Export comprehensive system report."""
-        report = {
-            "system_metrics": self.get_system_metrics(),
-            "top_operators": self.get_top_operators(20),
-            "strategy_distribution": self.get_strategy_distribution(),
-            "concentration_metrics": self.get_concentration_metrics(),
-            "cache_stats": self.get_cache_stats()
-        }
-        self._export_data(report, file_path, "json")
+        """
+        Export comprehensive system report.
+        
+        Each section is written to the file as soon as it is computed,
+        so the whole report is never held in memory at once. Sections are
+        streamed into a sibling temp file that replaces the target only
+        once the report is complete.
+        """
+        file_path = Path(file_path)
+        tmp_path = f"{file_path}.tmp"
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b'{"system_metrics":')
+                f.write(dumps(self.get_system_metrics()))
+                
+                f.write(b',"top_operators":[')
+                for i, operator in enumerate(self.get_top_operators(20)):
+                    if i:
+                        f.write(b',')
+                    f.write(dumps(operator))
+                f.write(b']')
+                
+                f.write(b',"strategy_distribution":')
+                f.write(dumps(self.get_strategy_distribution()))
+                f.write(b',"concentration_metrics":')
+                f.write(dumps(self.get_concentration_metrics()))
+                f.write(b',"cache_stats":')
+                f.write(dumps(self.get_cache_stats()))
+                f.write(b'}')
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            # Leave any previous report untouched and drop the partial one
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        
+        logger.info("System report exported to %s", file_path)
     
     def _export_data(self, data: Any, file_path: str, format: str) -> None:
         """Export data to file in specified format."""
-        import json
-        import pandas as pd
-        from datetime import datetime
-        
-        # Convert dataclasses to dict for serialization
-        if hasattr(data, '__dict__'):
-            data = data.__dict__
-        elif isinstance(data, list) and data and hasattr(data[0], '__dict__'):
-            data = [item.__dict__ for item in data]
-        
         file_path = Path(file_path)
         
         if format.lower() == "json":
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Dataclasses are serialized natively, no __dict__ pass needed
+            with open(file_path, 'wb') as f:
+                f.write(dumps(data, indent=True))
         elif format.lower() == "csv":
-            df = pd.DataFrame(data)
-            df.to_csv(file_path, index=False)
+            with open(file_path, 'w', newline='') as f:
+                if data:
+                    fieldnames = [field.name for field in dataclasses.fields(data[0])]
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    # Rows are built lazily, one resident at a time
+                    writer.writerows(
+                        {name: getattr(item, name) for name in fieldnames}
+                        for item in data
+                    )
         else:
             raise ValueError(f"Unsupported format: {format}")
         
-        logger.info(f"Data exported to {file_path}")
+        logger.info("Data exported to %s", file_path)
     
     def close(self) -> None:
         """Close database connections and cleanup resources."""
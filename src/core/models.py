@@ -3,12 +3,15 @@ Data models for EigenLayer analysis.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Final, List, Optional, Any
 from decimal import Decimal
 from datetime import datetime
 
+# Decimal is immutable, so one zero can be shared as a plain default
+_DEC_ZERO: Final = Decimal(0)
 
-@dataclass
+
+@dataclass(slots=True)
 class OperatorStats:
     """Data model for operator statistics."""
     address: str
@@ -26,11 +29,11 @@ class OperatorStats:
     
     # Metrics
     num_stakers: int = 0
-    eth_tvl: Decimal = field(default_factory=lambda: Decimal(0))
-    eigen_tvl: Decimal = field(default_factory=lambda: Decimal(0))
-    total_tvl_usd: Decimal = field(default_factory=lambda: Decimal(0))
+    eth_tvl: Decimal = field(default=_DEC_ZERO)
+    eigen_tvl: Decimal = field(default=_DEC_ZERO)
+    total_tvl_usd: Decimal = field(default=_DEC_ZERO)
     
-    # Strategy data
+    # Strategy data (shares are raw wei amounts, often wider than 64 bits)
     strategy_shares: Dict[str, int] = field(default_factory=dict)
     strategy_tokens: Dict[str, Decimal] = field(default_factory=dict)
     strategy_usd_values: Dict[str, Decimal] = field(default_factory=dict)
@@ -45,7 +48,7 @@ class OperatorStats:
     last_updated: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AVSMetrics:
     """Data model for AVS metrics."""
     address: str
@@ -58,18 +61,18 @@ class AVSMetrics:
     # Metrics
     operator_count: int = 0
     staker_count: int = 0
-    eth_tvl: Decimal = field(default_factory=lambda: Decimal(0))
-    total_tvl_usd: Decimal = field(default_factory=lambda: Decimal(0))
+    eth_tvl: Decimal = field(default=_DEC_ZERO)
+    total_tvl_usd: Decimal = field(default=_DEC_ZERO)
     
-    # Strategy data
-    strategy_shares: Dict[str, Decimal] = field(default_factory=dict)
+    # Strategy data (shares are raw wei amounts, often wider than 64 bits)
+    strategy_shares: Dict[str, int] = field(default_factory=dict)
     
     # Metadata
     timestamp: Optional[datetime] = None
     last_updated: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyInfo:
     """Data model for strategy information."""
     address: str
@@ -81,32 +84,32 @@ class StrategyInfo:
     
     # Metrics
     operator_count: int = 0
-    total_tokens: Decimal = field(default_factory=lambda: Decimal(0))
-    total_usd_value: Decimal = field(default_factory=lambda: Decimal(0))
-    avg_usd_value_per_operator: Decimal = field(default_factory=lambda: Decimal(0))
+    total_tokens: Decimal = field(default=_DEC_ZERO)
+    total_usd_value: Decimal = field(default=_DEC_ZERO)
+    avg_usd_value_per_operator: Decimal = field(default=_DEC_ZERO)
     
     # Metadata
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """Data model for system-wide metrics."""
     total_operators: int = 0
     total_avs: int = 0
     total_registrations: int = 0
-    total_system_tvl_usd: Decimal = field(default_factory=lambda: Decimal(0))
-    total_system_eth_tvl: Decimal = field(default_factory=lambda: Decimal(0))
-    total_system_eigen_tvl: Decimal = field(default_factory=lambda: Decimal(0))
+    total_system_tvl_usd: Decimal = field(default=_DEC_ZERO)
+    total_system_eth_tvl: Decimal = field(default=_DEC_ZERO)
+    total_system_eigen_tvl: Decimal = field(default=_DEC_ZERO)
     total_unique_stakers: int = 0
-    avg_operator_tvl_usd: Decimal = field(default_factory=lambda: Decimal(0))
+    avg_operator_tvl_usd: Decimal = field(default=_DEC_ZERO)
     
     # Metadata
     last_update: Optional[datetime] = None
     analysis_timestamp: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     """Data model for cache statistics."""
     cache_type: str
@@ -117,7 +120,7 @@ class CacheStats:
     avg_response_time_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Data model for performance metrics."""
     operation: str
@@ -0,0 +1,96 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths return UTF-8 encoded bytes, write
+datetimes in ISO 8601 form and write integers wider than 64 bits, such
+as raw share amounts in wei, as strings.
+"""
+
+import dataclasses
+import datetime
+import json
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if orjson is not None:
+    # Dataclasses go through _default so wide ints in their fields can be
+    # converted; orjson rejects those before default= is ever consulted
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+# Integer range orjson can encode as a JSON number
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 64 - 1
+
+# Dataclass type -> field names
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _widen(value: Any) -> Any:
+    """Write ints outside 64 bits as strings, descending into dicts and lists."""
+    value_type = type(value)
+    if value_type is int:
+        return value if _INT_MIN <= value <= _INT_MAX else str(value)
+    if value_type is dict:
+        return {key: _widen(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_widen(item) for item in value]
+    return value
+
+
+def _dataclass_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow field dict of a dataclass instance, without asdict's deep copy."""
+    names = _FIELD_NAMES.get(type(obj))
+    if names is None:
+        names = _FIELD_NAMES[type(obj)] = tuple(f.name for f in dataclasses.fields(obj))
+    return {name: _widen(getattr(obj, name)) for name in names}
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for types orjson does not handle natively."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _dataclass_dict(obj)
+    return str(obj)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback serializer for the stdlib json path, matching orjson output."""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    return _default(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON.
+
+    Dataclasses are written as objects of their fields; Decimals, ints
+    wider than 64 bits and other unknown types are written as strings.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    obj = _widen(obj)
+
+    if orjson is not None:
+        option = (_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=_default, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, default=_json_default)
+    else:
+        # Compact separators, as orjson writes them
+        text = json.dumps(obj, separators=(",", ":"), default=_json_default)
+    return text.encode("utf-8")
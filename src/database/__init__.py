@@ -5,11 +5,13 @@ Handles DuckDB schema creation, data import, and database operations.
 """
 
 from .manager import DatabaseManager
+from .pool import DuckDBPool
 from .schema import DatabaseSchema
 from .importers import DataImporter
 
 __all__ = [
     "DatabaseManager",
+    "DuckDBPool",
     "DatabaseSchema", 
     "DataImporter"
 ]
\ No newline at end of file
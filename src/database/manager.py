@@ -3,40 +3,124 @@ Database manager for DuckDB operations.
 """
 
 import duckdb
+import functools
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from .pool import DuckDBPool
 from .schema import DatabaseSchema
 from ..core.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Tables reported by get_database_stats
+STATS_TABLES = (
+    'operators', 'operator_metrics', 'avs', 'avs_metrics',
+    'operator_avs_registrations', 'strategies',
+    'operator_strategy_shares', 'avs_strategy_shares'
+)
+
+# Most recently used parsed statements kept per manager
+PREPARED_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _build_count_query(tables: Tuple[str, ...]) -> str:
+    """Build a single query returning (table, row count) for each table."""
+    return " UNION ALL ".join(
+        f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}"
+        for table in tables
+    )
+
 
 class DatabaseManager:
-    """Manages DuckDB database operations."""
+    """
+    Manages DuckDB database operations.
     
-    def __init__(self, db_path: str = "eigenlayer_data.duckdb"):
+    self.conn is not shared raw across threads. Worker threads should take
+    their own cursor via cursor() or scoped_cursor() and pass it as con
+    to the query helpers.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "eigenlayer_data.duckdb",
+        pool_size: int = 4,
+        read_only: bool = False,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None
+    ):
         """
         Initialize database manager.
         
         Args:
             db_path: Path to DuckDB database file
+            pool_size: Maximum cursors in the read pool used by parallel fetches
+            read_only: Open without write access, so several processes can
+                read the same file
+            threads: DuckDB worker threads, defaults to DuckDB's own choice
+            memory_limit: DuckDB memory limit such as "4GB"
         """
         self.db_path = Path(db_path)
+        self.pool_size = pool_size
+        self.read_only = read_only
+        self.threads = threads
+        self.memory_limit = memory_limit
         self.conn = None
+        self.pool = None
+        
+        # (table, columns, conflict_columns) -> INSERT or upsert SQL
+        self._sql_cache: Dict[tuple, str] = {}
+        
+        # SQL text -> parsed statement, LRU bounded and shared by cursors
+        self._prepared: "OrderedDict[str, duckdb.Statement]" = OrderedDict()
+        self._prepared_lock = threading.Lock()
+        
+        # Names of tables in the main schema, loaded on first use
+        self._table_cache: Optional[Set[str]] = None
+        
         self._connect()
+    
+    @classmethod
+    def open_read_only(cls, db_path: str, **kwargs: Any) -> "DatabaseManager":
+        """
+        Open an existing database for reading only, e.g. for dashboards.
+        
+        Args:
+            db_path: Path to DuckDB database file
+            **kwargs: Further DatabaseManager arguments
+            
+        Returns:
+            Read-only DatabaseManager
+        """
+        return cls(db_path, read_only=True, **kwargs)
         
     def _connect(self) -> None:
         """Establish database connection."""
+        # Applied at open time, equivalent to PRAGMA threads / memory_limit
+        config: Dict[str, Any] = {}
+        if self.threads:
+            config["threads"] = self.threads
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        
         try:
-            self.conn = duckdb.connect(str(self.db_path))
+            self.conn = duckdb.connect(
+                str(self.db_path), read_only=self.read_only, config=config
+            )
+            self.pool = DuckDBPool(self.conn, self.pool_size)
             logger.info(f"Connected to database: {self.db_path}")
         except Exception as e:
             raise DatabaseError(f"Failed to connect to database: {e}")
     
     def create_schema(self) -> None:
         """Create database schema with all tables and views."""
+        self._table_cache = None
         try:
             schema = DatabaseSchema(self.conn)
             schema.create_all_tables()
@@ -46,81 +130,291 @@ class DatabaseManager:
         except Exception as e:
             raise DatabaseError(f"Schema creation failed: {e}")
     
-    def import_strategies(self) -> None:
-        """Import strategy reference data."""
+    def import_strategies(self, autocommit: bool = True) -> None:
+        """
+        Import strategy reference data.
+        
+        Args:
+            autocommit: Commit on success, False to join the caller's
+                transaction
+        """
         try:
             schema = DatabaseSchema(self.conn)
-            schema.import_strategies()
+            schema.import_strategies(autocommit=autocommit)
             logger.info("Strategy data imported successfully")
         except Exception as e:
             raise DatabaseError(f"Strategy import failed: {e}")
     
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> Any:
+    def refresh_materialized_views(self, autocommit: bool = True) -> None:
+        """
+        Rebuild the tables behind the materialized views after an import.
+        
+        Args:
+            autocommit: Commit on success, False to join the caller's
+                transaction
+        """
+        try:
+            schema = DatabaseSchema(self.conn)
+            schema.refresh_materialized_views(autocommit=autocommit)
+        except Exception as e:
+            raise DatabaseError(f"Materialized view refresh failed: {e}")
+    
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Create a new cursor on this manager's database.
+        
+        Cursors are lightweight connections sharing the same database, so
+        queries on separate cursors can run concurrently.
+        
+        Returns:
+            DuckDB cursor, closed by the caller
+        """
+        return self.conn.cursor()
+    
+    @contextmanager
+    def scoped_cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Yield a cursor for the current thread and close it afterwards."""
+        cursor = self.conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Run several writes as one transaction on the manager connection.
+        
+        Pass autocommit=False to the write helpers (bulk_insert,
+        insert_or_update, import_strategies, refresh_materialized_views)
+        inside the block. Commits when the block exits, rolls back if it
+        raises, including on KeyboardInterrupt.
+        """
+        self.conn.begin()
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+    
+    def _prepare(
+        self,
+        query: str,
+        con: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> Any:
+        """
+        Return the parsed statement for a query, parsing it on first use.
+        
+        DuckDB's Python client has no prepare(); statements from
+        extract_statements() play that role, since execute() and
+        executemany() run them without parsing the SQL again.
+        Multi-statement strings are returned unchanged.
+        
+        Args:
+            query: SQL query string
+            con: Cursor that will run the query, used for parsing so worker
+                threads do not contend on the manager connection
+            
+        Returns:
+            Parsed statement, or the query string if it is not cacheable
+        """
+        with self._prepared_lock:
+            statement = self._prepared.get(query)
+            if statement is not None:
+                self._prepared.move_to_end(query)
+                return statement
+        
+        statements = (con or self.conn).extract_statements(query)
+        if len(statements) != 1:
+            return query
+        statement = statements[0]
+        
+        with self._prepared_lock:
+            self._prepared[query] = statement
+            if len(self._prepared) > PREPARED_CACHE_SIZE:
+                self._prepared.popitem(last=False)
+        return statement
+    
+    def execute_query(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        con: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> Any:
         """
         Execute a database query.
         
         Args:
             query: SQL query string
             params: Query parameters
+            con: Cursor to run on, defaults to the manager connection
             
         Returns:
             Query result
         """
+        if con is None:
+            con = self.conn
+        
         try:
             if params:
-                return self.conn.execute(query, params)
+                # Parameterized queries are templates run repeatedly
+                return con.execute(self._prepare(query, con), params)
             else:
-                return self.conn.execute(query)
+                return con.execute(query)
         except Exception as e:
             raise DatabaseError(f"Query execution failed: {e}")
     
-    def fetch_dataframe(self, query: str, params: Optional[tuple] = None):
+    def fetch_dataframe(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        con: Optional[duckdb.DuckDBPyConnection] = None,
+        parallel: bool = False
+    ):
         """
         Execute query and return results as pandas DataFrame.
         
         Args:
             query: SQL query string
             params: Query parameters
+            con: Cursor to run on, defaults to the manager connection
+            parallel: Run on a pooled read cursor when con is not given
             
         Returns:
             pandas DataFrame with query results
         """
+        if parallel and con is None:
+            with self.pool.connection() as cursor:
+                return self.fetch_dataframe(query, params, con=cursor)
+        
         try:
-            result = self.execute_query(query, params)
+            result = self.execute_query(query, params, con)
             return result.df()
         except Exception as e:
             raise DatabaseError(f"DataFrame fetch failed: {e}")
     
-    def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[tuple]:
+    def fetch_arrow(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        con: Optional[duckdb.DuckDBPyConnection] = None
+    ):
+        """
+        Execute query and return results as a pyarrow Table.
+        
+        DuckDB produces columnar results natively, so this avoids the
+        per-column conversion done when building a DataFrame.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            con: Cursor to run on, defaults to the manager connection
+            
+        Returns:
+            pyarrow Table with query results
+        """
+        try:
+            result = self.execute_query(query, params, con)
+            # to_arrow_table replaced fetch_arrow_table in DuckDB 1.4
+            if hasattr(result, "to_arrow_table"):
+                return result.to_arrow_table()
+            return result.fetch_arrow_table()
+        except Exception as e:
+            raise DatabaseError(f"Arrow fetch failed: {e}")
+    
+    def fetch_record_batches(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        batch_size: int = 100_000,
+        con: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> Iterator[Any]:
+        """
+        Execute query and stream results as pyarrow RecordBatches.
+        
+        Without con, the stream runs on its own cursor, which is closed
+        when the generator finishes or is closed. Other queries on the
+        manager connection would otherwise end the stream early. Being a
+        generator, the query only runs, and execution errors only surface,
+        on the first next().
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Maximum rows per batch
+            con: Cursor to run on, defaults to a dedicated cursor
+            
+        Yields:
+            pyarrow RecordBatch objects
+        """
+        own_cursor = con is None
+        if own_cursor:
+            con = self.conn.cursor()
+        
+        try:
+            result = self.execute_query(query, params, con)
+            # to_arrow_reader replaced fetch_record_batch in DuckDB 1.4
+            if hasattr(result, "to_arrow_reader"):
+                reader = result.to_arrow_reader(batch_size)
+            else:
+                reader = result.fetch_record_batch(batch_size)
+            
+            yield from reader
+        except Exception as e:
+            raise DatabaseError(f"Record batch fetch failed: {e}")
+        finally:
+            if own_cursor:
+                con.close()
+    
+    def fetch_one(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        con: Optional[duckdb.DuckDBPyConnection] = None
+    ) -> Optional[tuple]:
         """
         Execute query and return first result.
         
         Args:
             query: SQL query string
             params: Query parameters
+            con: Cursor to run on, defaults to the manager connection
             
         Returns:
             First result tuple or None
         """
         try:
-            result = self.execute_query(query, params)
+            result = self.execute_query(query, params, con)
             return result.fetchone()
         except Exception as e:
             raise DatabaseError(f"Single fetch failed: {e}")
     
-    def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[tuple]:
+    def fetch_all(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        con: Optional[duckdb.DuckDBPyConnection] = None,
+        parallel: bool = False
+    ) -> List[tuple]:
         """
         Execute query and return all results.
         
         Args:
             query: SQL query string
             params: Query parameters
+            con: Cursor to run on, defaults to the manager connection
+            parallel: Run on a pooled read cursor when con is not given
             
         Returns:
             List of result tuples
         """
+        if parallel and con is None:
+            with self.pool.connection() as cursor:
+                return self.fetch_all(query, params, con=cursor)
+        
         try:
-            result = self.execute_query(query, params)
+            result = self.execute_query(query, params, con)
             return result.fetchall()
         except Exception as e:
             raise DatabaseError(f"Multiple fetch failed: {e}")
@@ -129,7 +423,8 @@ class DatabaseManager:
         self, 
         table: str, 
         data: Dict[str, Any], 
-        conflict_columns: List[str]
+        conflict_columns: List[str],
+        autocommit: bool = True
     ) -> None:
         """
         Insert or update data in table.
@@ -138,72 +433,148 @@ class DatabaseManager:
             table: Table name
             data: Data dictionary
             conflict_columns: Columns to check for conflicts
+            autocommit: Commit on success, False to join the caller's
+                transaction
         """
-        try:
-            columns = list(data.keys())
-            values = list(data.values())
-            placeholders = ', '.join(['?' for _ in values])
-            
-            # Build conflict resolution
-            conflict_clause = ', '.join(conflict_columns)
-            update_clause = ', '.join([
-                f"{col} = EXCLUDED.{col}" 
-                for col in columns if col not in conflict_columns
-            ])
-            
-            query = f"""
-                INSERT INTO {table} ({', '.join(columns)})
-                VALUES ({placeholders})
-                ON CONFLICT ({conflict_clause}) DO UPDATE SET
-                {update_clause}
-            """
-            
-            self.execute_query(query, tuple(values))
-            self.conn.commit()
-            
-        except Exception as e:
-            self.conn.rollback()
-            raise DatabaseError(f"Insert/update failed: {e}")
+        self.bulk_insert(table, [data], conflict_columns, autocommit=autocommit)
     
     def bulk_insert(
         self, 
         table: str, 
         data: List[Dict[str, Any]], 
-        conflict_columns: Optional[List[str]] = None
+        conflict_columns: Optional[List[str]] = None,
+        snapshot_ts: Optional[datetime] = None,
+        autocommit: bool = True
     ) -> None:
         """
         Bulk insert data into table.
         
+        All rows are written in a single transaction.
+        
         Args:
             table: Table name
             data: List of data dictionaries
             conflict_columns: Columns to check for conflicts
+            snapshot_ts: Timestamp for rows without a "timestamp" value, so
+                a whole snapshot shares one explicit timestamp
+            autocommit: Begin and commit the transaction here. Pass False
+                inside transaction() so several calls commit together
         """
         if not data:
             return
             
+        # Group rows by column set, each group runs as one statement that
+        # is parsed and planned once
+        groups: Dict[tuple, List[tuple]] = {}
+        for row in data:
+            columns = tuple(row)
+            values = tuple(row.values())
+            if snapshot_ts is not None and "timestamp" not in row:
+                columns += ("timestamp",)
+                values += (snapshot_ts,)
+            groups.setdefault(columns, []).append(values)
+        
+        if autocommit:
+            self.conn.begin()
+        
         try:
-            for row in data:
-                if conflict_columns:
-                    self.insert_or_update(table, row, conflict_columns)
-                else:
-                    columns = list(row.keys())
-                    values = list(row.values())
-                    placeholders = ', '.join(['?' for _ in values])
-                    
-                    query = f"""
-                        INSERT INTO {table} ({', '.join(columns)})
-                        VALUES ({placeholders})
-                    """
-                    
-                    self.execute_query(query, tuple(values))
+            for columns, values in groups.items():
+                query = self._get_insert_query(table, columns, conflict_columns)
+                self.conn.executemany(self._prepare(query), values)
             
-            self.conn.commit()
+            if autocommit:
+                self.conn.commit()
             logger.info(f"Bulk inserted {len(data)} rows into {table}")
             
         except Exception as e:
-            self.conn.rollback()
+            # An outer transaction is rolled back by its owner
+            if autocommit:
+                self.conn.rollback()
             raise DatabaseError(f"Bulk insert failed: {e}")
+        except BaseException:
+            # e.g. KeyboardInterrupt, never leave our transaction open
+            if autocommit:
+                self.conn.rollback()
+            raise
+    
+    def _get_insert_query(
+        self,
+        table: str,
+        columns: tuple,
+        conflict_columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Return the cached INSERT SQL for a table and column set.
+        
+        Columns are keyed in row order, which rows from one producer
+        share, so no per-row sort or value reordering is needed.
+        """
+        key = (table, columns, tuple(conflict_columns or ()))
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = self._build_insert_query(table, list(columns), conflict_columns)
+            self._sql_cache[key] = query
+        return query
+    
+    @staticmethod
+    def _build_insert_query(
+        table: str,
+        columns: List[str],
+        conflict_columns: Optional[List[str]] = None
+    ) -> str:
+        """
+        Build a parameterized INSERT, optionally with an upsert clause.
+        
+        Args:
+            table: Table name
+            columns: Columns to insert, in parameter order
+            conflict_columns: Columns to check for conflicts
+            
+        Returns:
+            SQL query string
+        """
+        placeholders = ', '.join(['?' for _ in columns])
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        
+        if conflict_columns:
+            update_columns = [col for col in columns if col not in conflict_columns]
+            query += f" ON CONFLICT ({', '.join(conflict_columns)})"
+            if update_columns:
+                query += " DO UPDATE SET " + ', '.join(
+                    f"{col} = EXCLUDED.{col}" for col in update_columns
+                )
+            else:
+                query += " DO NOTHING"
+        
+        return query
+    
+    def top_operators_by_tvl(self, n: int = 100) -> List[tuple]:
+        """
+        Get the operators with the highest current TVL.
+        
+        Sorts the current stats view under a LIMIT, which DuckDB runs as a
+        top-N instead of ranking every operator through a window.
+        
+        Args:
+            n: Number of operators to return
+            
+        Returns:
+            List of (operator_address, name, total_tvl_usd, eth_tvl,
+            eigen_tvl, num_stakers, avs_count) tuples
+        """
+        return self.fetch_all("""
+            SELECT 
+                operator_address,
+                name,
+                total_tvl_usd,
+                eth_tvl,
+                eigen_tvl,
+                num_stakers,
+                avs_count
+            FROM v_operator_current_stats
+            ORDER BY total_tvl_usd DESC
+            LIMIT ?
+        """, (n,))
     
     def get_table_count(self, table: str) -> int:
         """Get row count for table."""
@@ -213,15 +584,20 @@ class DatabaseManager:
         except Exception as e:
             raise DatabaseError(f"Count query failed: {e}")
     
+    def _list_tables(self) -> Set[str]:
+        """Return the names of all base tables, cached until the schema is rebuilt."""
+        if self._table_cache is None:
+            rows = self.fetch_all("""
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = 'main' AND table_type = 'BASE TABLE'
+            """)
+            self._table_cache = {row[0] for row in rows}
+        return self._table_cache
+    
     def table_exists(self, table: str) -> bool:
         """Check if table exists."""
         try:
-            query = """
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name=?
-            """
-            result = self.fetch_one(query, (table,))
-            return result is not None
+            return table in self._list_tables()
         except Exception as e:
             logger.warning(f"Table existence check failed: {e}")
             return False
@@ -229,18 +605,12 @@ class DatabaseManager:
     def get_database_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
         try:
-            tables = [
-                'operators', 'operator_metrics', 'avs', 'avs_metrics',
-                'operator_avs_registrations', 'strategies', 
-                'operator_strategy_shares', 'avs_strategy_shares'
-            ]
+            stats = dict.fromkeys(STATS_TABLES, 0)
             
-            stats = {}
-            for table in tables:
-                if self.table_exists(table):
-                    stats[table] = self.get_table_count(table)
-                else:
-                    stats[table] = 0
+            tables = self._list_tables()
+            existing = tuple(table for table in STATS_TABLES if table in tables)
+            if existing:
+                stats.update(self.fetch_all(_build_count_query(existing)))
             
             return stats
         except Exception as e:
@@ -256,6 +626,9 @@ class DatabaseManager:
     
     def close(self) -> None:
         """Close database connection."""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
         if self.conn:
             self.conn.close()
             self.conn = None
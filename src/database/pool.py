@@ -0,0 +1,107 @@
+"""
+Connection pool for concurrent DuckDB reads.
+"""
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import duckdb
+
+from ..core.exceptions import DatabaseError
+
+logger = logging.getLogger(__name__)
+
+
+class DuckDBPool:
+    """
+    Bounded pool of cursors cloned from one DuckDB connection.
+
+    Cursors share the underlying database, so SELECTs on separate pooled
+    cursors run concurrently under DuckDB's MVCC. Intended for read
+    workloads; writes should stay on the owning connection.
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, size: int = 4):
+        """
+        Initialize connection pool.
+
+        Args:
+            connection: DuckDB connection to clone cursors from
+            size: Maximum number of cursors
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be positive: {size}")
+
+        self.conn = connection
+        self.size = size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+        # Every cursor handed out, idle or checked out, so close() reaches all
+        self._cursors: List[duckdb.DuckDBPyConnection] = []
+
+    def checkout(self, timeout: Optional[float] = None) -> duckdb.DuckDBPyConnection:
+        """
+        Take a cursor from the pool, creating one if below the size limit.
+
+        Args:
+            timeout: Seconds to wait for a free cursor, None waits forever
+
+        Returns:
+            DuckDB cursor, to be handed back with return_()
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                cursor = self.conn.cursor()
+                self._created += 1
+                self._cursors.append(cursor)
+                return cursor
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise DatabaseError(f"No pooled connection available after {timeout}s")
+
+    def return_(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Hand a checked out cursor back to the pool."""
+        with self._lock:
+            # Cursors outliving close() were already closed, drop them
+            if not any(c is cursor for c in self._cursors):
+                return
+        self._idle.put(cursor)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a cursor for the duration of a with block."""
+        cursor = self.checkout(timeout)
+        try:
+            yield cursor
+        finally:
+            self.return_(cursor)
+
+    def close(self) -> None:
+        """Close every cursor created by the pool, including checked out ones."""
+        with self._lock:
+            cursors, self._cursors = self._cursors, []
+            self._created = 0
+
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.warning("Failed to close pooled cursor: %s", e)
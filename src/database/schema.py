@@ -7,9 +7,167 @@ from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# Strategy reference data: (strategy_address, symbol, name, underlying_token,
+# coingecko_id, decimals)
+STRATEGIES = (
+    ("0x93c4b944D05dfe6df7645A86cd2206016c51564D", "stETH", "Lido Staked ETH", 
+     "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84", "staked-ether", 18),
+    ("0x1BeE69b7dFFfA4E2d53C2a2Df135C388AD25dCD2", "rETH", "Rocket Pool ETH", 
+     "0xae78736Cd615f374D3085123A210448E74Fc6393", "rocket-pool-eth", 18),
+    ("0x54945180dB7943c0ed0FEE7EdaB2Bd24620256bc", "cbETH", "Coinbase Wrapped ETH", 
+     "0xBe9895146f7AF43049ca1c1AE358B0541Ea49704", "coinbase-wrapped-staked-eth", 18),
+    ("0xaCB55C530Acdb2849e6d4f36992Cd8c9D50ED8F7", "EIGEN", "Eigen", 
+     "0xec53bF9167f50cDEB3Ae105f56099aaaB9061F83", "eigenlayer", 18),
+    ("0xbeaC0eeEeeeeEEeEeEEEEeeEEeEeeeEeeEEBEaC0", "beaconETH", "Beacon ETH", 
+     "0xbeaC0eeEeeeeEEeEeEEEEeeEEeEeeeEeeEEBEaC0", "ethereum", 18),
+)
+
+STRATEGY_UPSERT_SQL = """
+    INSERT INTO strategies 
+    (strategy_address, symbol, name, underlying_token, coingecko_id, decimals)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (strategy_address) DO UPDATE SET
+        symbol = EXCLUDED.symbol,
+        name = EXCLUDED.name,
+        underlying_token = EXCLUDED.underlying_token,
+        coingecko_id = EXCLUDED.coingecko_id,
+        decimals = EXCLUDED.decimals
+"""
+
+
+# Expensive views backed by m_* tables, rebuilt by refresh_materialized_views:
+# name -> (query, index columns, view ORDER BY)
+MATERIALIZED_VIEWS = {
+    "operator_current_stats": (
+        """
+        WITH latest_om AS (
+            SELECT *
+            FROM operator_metrics
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY operator_address ORDER BY timestamp DESC
+            ) = 1
+        ),
+        active_avs AS (
+            SELECT operator_address, COUNT(*) as avs_count
+            FROM operator_avs_registrations
+            WHERE is_active = TRUE
+            GROUP BY operator_address
+        )
+        SELECT 
+            o.operator_address,
+            o.name,
+            o.website,
+            o.twitter,
+            om.num_stakers,
+            om.eth_tvl,
+            om.eigen_tvl,
+            om.total_tvl_usd,
+            om.timestamp as last_updated,
+            COALESCE(aa.avs_count, 0) as avs_count
+        FROM operators o
+        JOIN latest_om om ON o.operator_address = om.operator_address
+        LEFT JOIN active_avs aa ON o.operator_address = aa.operator_address
+        """,
+        "operator_address",
+        None,
+    ),
+    "avs_current_stats": (
+        """
+        WITH latest_am AS (
+            SELECT *
+            FROM avs_metrics
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY avs_address ORDER BY timestamp DESC
+            ) = 1
+        )
+        SELECT 
+            a.avs_address,
+            a.name,
+            a.website,
+            am.operator_count,
+            am.staker_count,
+            am.eth_tvl,
+            am.total_tvl_usd,
+            am.timestamp as last_updated
+        FROM avs a
+        JOIN latest_am am ON a.avs_address = am.avs_address
+        """,
+        "avs_address",
+        None,
+    ),
+    "strategy_distribution": (
+        """
+        WITH latest_oss AS (
+            SELECT *
+            FROM operator_strategy_shares
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY operator_address, strategy_address
+                ORDER BY timestamp DESC
+            ) = 1
+        )
+        SELECT 
+            s.symbol,
+            s.name as strategy_name,
+            COUNT(DISTINCT oss.operator_address) as operator_count,
+            SUM(oss.tokens) as total_tokens,
+            SUM(oss.usd_value) as total_usd_value,
+            AVG(oss.usd_value) as avg_usd_value_per_operator
+        FROM latest_oss oss
+        JOIN strategies s ON oss.strategy_address = s.strategy_address
+        GROUP BY s.symbol, s.name
+        """,
+        "symbol",
+        "total_usd_value DESC",
+    ),
+    "system_aggregate_metrics": (
+        """
+        WITH latest_om AS (
+            SELECT *
+            FROM operator_metrics
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY operator_address ORDER BY timestamp DESC
+            ) = 1
+        ),
+        tvl AS (
+            SELECT 
+                COALESCE(SUM(total_tvl_usd), 0) as total_system_tvl_usd,
+                COALESCE(SUM(eth_tvl), 0) as total_system_eth_tvl,
+                COALESCE(SUM(eigen_tvl), 0) as total_system_eigen_tvl,
+                COALESCE(SUM(num_stakers), 0) as total_unique_stakers,
+                COALESCE(AVG(total_tvl_usd), 0) as avg_operator_tvl_usd,
+                MAX(timestamp) as last_update
+            FROM latest_om
+        )
+        SELECT 
+            (SELECT COUNT(*) FROM operators) as total_operators,
+            (SELECT COUNT(*) FROM avs) as total_avs,
+            (SELECT COUNT(*) FROM operator_avs_registrations WHERE is_active = TRUE)
+                as total_registrations,
+            tvl.total_system_tvl_usd,
+            tvl.total_system_eth_tvl,
+            tvl.total_system_eigen_tvl,
+            tvl.total_unique_stakers,
+            tvl.avg_operator_tvl_usd,
+            tvl.last_update
+        FROM tvl
+        """,
+        None,
+        None,
+    ),
+}
+
 
 class DatabaseSchema:
-    """Manages database schema creation and maintenance."""
+    """
+    Manages database schema creation and maintenance.
+    
+    Metric DECIMAL columns are kept within 64-bit precision: token amounts
+    (eth_tvl, eigen_tvl, tokens) are DECIMAL(18, 8) and USD values
+    (total_tvl_usd, usd_value) are DECIMAL(18, 2). DuckDB rounds extra
+    decimal places half away from zero on write, so token amounts are
+    lossy below 1e-8 and USD values below one cent. Exact on-chain
+    amounts live in the integer shares columns.
+    """
     
     def __init__(self, connection):
         """
@@ -80,9 +238,9 @@ class DatabaseSchema:
                 timestamp TIMESTAMP,
                 block_number BIGINT,
                 num_stakers INTEGER DEFAULT 0,
-                eth_tvl DECIMAL(30, 18) DEFAULT 0,
-                eigen_tvl DECIMAL(30, 18) DEFAULT 0,
-                total_tvl_usd DECIMAL(30, 2) DEFAULT 0,
+                eth_tvl DECIMAL(18, 8) DEFAULT 0,
+                eigen_tvl DECIMAL(18, 8) DEFAULT 0,
+                total_tvl_usd DECIMAL(18, 2) DEFAULT 0,
                 data_source VARCHAR DEFAULT 'unknown',
                 PRIMARY KEY (operator_address, timestamp),
                 FOREIGN KEY (operator_address) REFERENCES operators(operator_address)
@@ -112,8 +270,8 @@ class DatabaseSchema:
                 timestamp TIMESTAMP,
                 operator_count INTEGER DEFAULT 0,
                 staker_count INTEGER DEFAULT 0,
-                eth_tvl DECIMAL(30, 18) DEFAULT 0,
-                total_tvl_usd DECIMAL(30, 2) DEFAULT 0,
+                eth_tvl DECIMAL(18, 8) DEFAULT 0,
+                total_tvl_usd DECIMAL(18, 2) DEFAULT 0,
                 PRIMARY KEY (avs_address, timestamp),
                 FOREIGN KEY (avs_address) REFERENCES avs(avs_address)
             )
@@ -155,9 +313,9 @@ class DatabaseSchema:
                 strategy_address VARCHAR,
                 timestamp TIMESTAMP,
                 block_number BIGINT,
-                shares DECIMAL(38, 0) DEFAULT 0,
-                tokens DECIMAL(30, 18) DEFAULT 0,
-                usd_value DECIMAL(30, 2) DEFAULT 0,
+                shares HUGEINT DEFAULT 0,
+                tokens DECIMAL(18, 8) DEFAULT 0,
+                usd_value DECIMAL(18, 2) DEFAULT 0,
                 PRIMARY KEY (operator_address, strategy_address, timestamp),
                 FOREIGN KEY (operator_address) REFERENCES operators(operator_address),
                 FOREIGN KEY (strategy_address) REFERENCES strategies(strategy_address)
@@ -171,7 +329,7 @@ class DatabaseSchema:
                 avs_address VARCHAR,
                 strategy_address VARCHAR,
                 timestamp TIMESTAMP,
-                shares DECIMAL(38, 0) DEFAULT 0,
+                shares HUGEINT DEFAULT 0,
                 PRIMARY KEY (avs_address, strategy_address, timestamp),
                 FOREIGN KEY (avs_address) REFERENCES avs(avs_address),
                 FOREIGN KEY (strategy_address) REFERENCES strategies(strategy_address)
@@ -182,9 +340,12 @@ class DatabaseSchema:
         """Create database indexes for performance."""
         logger.info("Creating database indexes...")
         
+        # Per-entity latest-row lookups are served by the primary key
+        # indexes on (operator_address, timestamp), (avs_address, timestamp)
+        # and (operator_address, strategy_address, timestamp); duplicating
+        # them here would only slow down ingestion.
         indexes = [
             "CREATE INDEX idx_operator_metrics_tvl ON operator_metrics(total_tvl_usd DESC)",
-            "CREATE INDEX idx_operator_metrics_time ON operator_metrics(timestamp DESC)",
             "CREATE INDEX idx_avs_metrics_time ON avs_metrics(timestamp DESC)",
             "CREATE INDEX idx_operator_avs_active ON operator_avs_registrations(is_active)",
             "CREATE INDEX idx_operator_shares_time ON operator_strategy_shares(timestamp DESC)",
@@ -205,64 +366,48 @@ class DatabaseSchema:
         """Create database views for common queries."""
         logger.info("Creating database views...")
         
-        self._create_operator_current_stats_view()
-        self._create_avs_current_stats_view()
+        # Materialized views read from their m_* tables, built here first
+        self.refresh_materialized_views()
+        for name, (_, _, order_by) in MATERIALIZED_VIEWS.items():
+            query = f"CREATE OR REPLACE VIEW v_{name} AS SELECT * FROM m_{name}"
+            if order_by:
+                query += f" ORDER BY {order_by}"
+            self.conn.execute(query)
+        
         self._create_top_operators_view()
         self._create_operator_avs_matrix_view()
-        self._create_strategy_distribution_view()
-        self._create_system_aggregate_view()
         
         logger.info("Database views created")
     
-    def _create_operator_current_stats_view(self) -> None:
-        """Create current operator statistics view."""
-        self.conn.execute("""
-            CREATE OR REPLACE VIEW v_operator_current_stats AS
-            SELECT 
-                o.operator_address,
-                o.name,
-                o.website,
-                o.twitter,
-                om.num_stakers,
-                om.eth_tvl,
-                om.eigen_tvl,
-                om.total_tvl_usd,
-                om.timestamp as last_updated,
-                COUNT(DISTINCT oar.avs_address) as avs_count
-            FROM operators o
-            LEFT JOIN operator_metrics om ON o.operator_address = om.operator_address
-            LEFT JOIN operator_avs_registrations oar ON o.operator_address = oar.operator_address 
-                AND oar.is_active = TRUE
-            WHERE om.timestamp = (
-                SELECT MAX(timestamp) 
-                FROM operator_metrics om2 
-                WHERE om2.operator_address = o.operator_address
-            )
-            GROUP BY o.operator_address, o.name, o.website, o.twitter, 
-                     om.num_stakers, om.eth_tvl, om.eigen_tvl, om.total_tvl_usd, om.timestamp
-        """)
-    
-    def _create_avs_current_stats_view(self) -> None:
-        """Create current AVS statistics view."""
-        self.conn.execute("""
-            CREATE OR REPLACE VIEW v_avs_current_stats AS
-            SELECT 
-                a.avs_address,
-                a.name,
-                a.website,
-                am.operator_count,
-                am.staker_count,
-                am.eth_tvl,
-                am.total_tvl_usd,
-                am.timestamp as last_updated
-            FROM avs a
-            LEFT JOIN avs_metrics am ON a.avs_address = am.avs_address
-            WHERE am.timestamp = (
-                SELECT MAX(timestamp) 
-                FROM avs_metrics am2 
-                WHERE am2.avs_address = a.avs_address
-            )
-        """)
+    def refresh_materialized_views(self, autocommit: bool = True) -> None:
+        """
+        Rebuild the m_* tables behind the materialized views.
+        
+        The views show data as of the last refresh, so call this after
+        each import batch. Tables are swapped in one transaction, so
+        readers never see a partial refresh.
+        
+        Args:
+            autocommit: Run in its own transaction, False to join the
+                caller's transaction
+        """
+        if autocommit:
+            self.conn.begin()
+        try:
+            for name, (query, index_columns, _) in MATERIALIZED_VIEWS.items():
+                self.conn.execute(f"CREATE OR REPLACE TABLE m_{name} AS {query}")
+                if index_columns:
+                    self.conn.execute(
+                        f"CREATE INDEX idx_m_{name} ON m_{name}({index_columns})"
+                    )
+            if autocommit:
+                self.conn.commit()
+        except BaseException:
+            if autocommit:
+                self.conn.rollback()
+            raise
+        
+        logger.info("Materialized views refreshed")
     
     def _create_top_operators_view(self) -> None:
         """Create top operators view."""
@@ -276,7 +421,7 @@ class DatabaseSchema:
                 eigen_tvl,
                 num_stakers,
                 avs_count,
-                RANK() OVER (ORDER BY total_tvl_usd DESC) as tvl_rank
+                ROW_NUMBER() OVER (ORDER BY total_tvl_usd DESC) as tvl_rank
             FROM v_operator_current_stats
             ORDER BY total_tvl_usd DESC
         """)
@@ -299,81 +444,23 @@ class DatabaseSchema:
             ORDER BY o.name, a.name
         """)
     
-    def _create_strategy_distribution_view(self) -> None:
-        """Create strategy distribution view."""
-        self.conn.execute("""
-            CREATE OR REPLACE VIEW v_strategy_distribution AS
-            SELECT 
-                s.symbol,
-                s.name as strategy_name,
-                COUNT(DISTINCT oss.operator_address) as operator_count,
-                SUM(oss.tokens) as total_tokens,
-                SUM(oss.usd_value) as total_usd_value,
-                AVG(oss.usd_value) as avg_usd_value_per_operator
-            FROM operator_strategy_shares oss
-            JOIN strategies s ON oss.strategy_address = s.strategy_address
-            WHERE oss.timestamp = (
-                SELECT MAX(timestamp) 
-                FROM operator_strategy_shares oss2 
-                WHERE oss2.operator_address = oss.operator_address 
-                AND oss2.strategy_address = oss.strategy_address
-            )
-            GROUP BY s.symbol, s.name
-            ORDER BY total_usd_value DESC
-        """)
-    
-    def _create_system_aggregate_view(self) -> None:
-        """Create system aggregate metrics view."""
-        self.conn.execute("""
-            CREATE OR REPLACE VIEW v_system_aggregate_metrics AS
-            SELECT 
-                COUNT(DISTINCT o.operator_address) as total_operators,
-                COUNT(DISTINCT a.avs_address) as total_avs,
-                COUNT(DISTINCT oar.operator_address || '-' || oar.avs_address) as total_registrations,
-                COALESCE(SUM(om.total_tvl_usd), 0) as total_system_tvl_usd,
-                COALESCE(SUM(om.eth_tvl), 0) as total_system_eth_tvl,
-                COALESCE(SUM(om.eigen_tvl), 0) as total_system_eigen_tvl,
-                COALESCE(SUM(om.num_stakers), 0) as total_unique_stakers,
-                COALESCE(AVG(om.total_tvl_usd), 0) as avg_operator_tvl_usd,
-                MAX(om.timestamp) as last_update
-            FROM operators o
-            LEFT JOIN operator_metrics om ON o.operator_address = om.operator_address
-            LEFT JOIN operator_avs_registrations oar ON o.operator_address = oar.operator_address
-            LEFT JOIN avs a ON oar.avs_address = a.avs_address
-            WHERE om.timestamp = (
-                SELECT MAX(timestamp) 
-                FROM operator_metrics om2 
-                WHERE om2.operator_address = o.operator_address
-            )
-        """)
-    
-    def import_strategies(self) -> None:
-        """Import strategy reference data."""
-        strategies = [
-            ("0x93c4b944D05dfe6df7645A86cd2206016c51564D", "stETH", "Lido Staked ETH", 
-             "0xae7ab96520DE3A18E5e111B5EaAb095312D7fE84", "staked-ether", 18),
-            ("0x1BeE69b7dFFfA4E2d53C2a2Df135C388AD25dCD2", "rETH", "Rocket Pool ETH", 
-             "0xae78736Cd615f374D3085123A210448E74Fc6393", "rocket-pool-eth", 18),
-            ("0x54945180dB7943c0ed0FEE7EdaB2Bd24620256bc", "cbETH", "Coinbase Wrapped ETH", 
-             "0xBe9895146f7AF43049ca1c1AE358B0541Ea49704", "coinbase-wrapped-staked-eth", 18),
-            ("0xaCB55C530Acdb2849e6d4f36992Cd8c9D50ED8F7", "EIGEN", "Eigen", 
-             "0xec53bF9167f50cDEB3Ae105f56099aaaB9061F83", "eigenlayer", 18),
-            ("0xbeaC0eeEeeeeEEeEeEEEEeeEEeEeeeEeeEEBEaC0", "beaconETH", "Beacon ETH", 
-             "0xbeaC0eeEeeeeEEeEeEEEEeeEEeEeeeEeeEEBEaC0", "ethereum", 18)
-        ]
+    def import_strategies(self, autocommit: bool = True) -> None:
+        """
+        Import strategy reference data.
         
-        for strategy in strategies:
-            self.conn.execute("""
-                INSERT INTO strategies 
-                (strategy_address, symbol, name, underlying_token, coingecko_id, decimals)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT (strategy_address) DO UPDATE SET
-                    symbol = EXCLUDED.symbol,
-                    name = EXCLUDED.name,
-                    underlying_token = EXCLUDED.underlying_token,
-                    coingecko_id = EXCLUDED.coingecko_id,
-                    decimals = EXCLUDED.decimals
-            """, strategy)
+        Args:
+            autocommit: Run in its own transaction, False to join the
+                caller's transaction
+        """
+        if autocommit:
+            self.conn.begin()
+        try:
+            self.conn.executemany(STRATEGY_UPSERT_SQL, STRATEGIES)
+            if autocommit:
+                self.conn.commit()
+        except BaseException:
+            if autocommit:
+                self.conn.rollback()
+            raise
         
-        self.conn.commit()
         logger.info("Strategy data imported")
\ No newline at end of file